@@ -2,21 +2,47 @@
 # SPDX-License-Identifier: MIT
 
 from pathlib import Path
-import re
+import socket
 import time
 import threading
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
 import appdaemon.plugins.hass.hassapi as hass
 
 from adb_shell.adb_device import AdbDeviceTcp
 from adb_shell.auth.sign_pythonrsa import PythonRSASigner
+from adb_shell.exceptions import AdbCommandFailureException
 from twitch_firetvappstate.handshake import Handshake
 
 
 class TwitchPlayback(hass.Hass):
     """ produce entities describing the state of thw twitch app """
 
+    _PB_STATE_MEANINGS = {
+        "1": "stopped/idle/menu",
+        "3": "playing",
+        "6": "transition/unknown (observed)",
+    }
+    # unchanged polls tolerated at the base interval before backing off
+    _BACKOFF_AFTER_POLLS = 3
+    # stdout dumps that must miss in a row (while the file dump works)
+    # before stdout mode is given up; single misses are just the usual flakiness
+    _UIA_TTY_MAX_MISSES = 3
+    # kernel keepalive for the idle adb socket: probe after 30s idle, every 10s,
+    # give up after 3 misses (the tunables only exist on some platforms)
+    _TCP_KEEPALIVE_OPTS = (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    # printed between commands batched by _adb_shell_multi
+    _SHELL_SEP = b"__SEP__"
+    # Per-poll probes, batched into one shell: the focus lines, then the Twitch
+    # media_session block -- run on the device only when Twitch has focus ($f is
+    # set by the first command), and cut down to the lines
+    # _parse_twitch_playbackstate actually looks at.
+    _PROBE_CMDS = (
+        'f=$(dumpsys window | grep mCurrentFocus=); echo "$f"',
+        'case "$f" in *tv.twitch.android.viewer*) '
+        "dumpsys media_session | grep -A 40 'TwitchMediaSession tv.twitch.android.viewer';; esac",
+    )
+
     entity_prefix: str  # prefix to prepend to generated entity values
     session_header: str  # header to key-in on for twitch is-active status
     adb: Optional[AdbDeviceTcp]  # adb device holder
@@ -27,9 +53,28 @@ class TwitchPlayback(hass.Hass):
     last_playbackactivechannel: Optional[str]  # previous playbackactivechannel
     adbkey: Path  # adb private key
     adbkey_pub: Path  # adb pub key
+    _signer: Optional[PythonRSASigner]  # loaded once; the keys don't change at runtime
     _adb_lock: threading.Lock  # serialize the (non-thread-safe) adb socket
     _dump_in_flight: bool  # a background dump worker is running
+    _uia_tty_ok: Optional[bool]  # uiautomator can dump to stdout (None: not yet known)
+    _uia_tty_misses: int  # consecutive stdout misses the file dump recovered from
+    _last_probe_out: tuple  # raw (window, media_session) output of the previous poll
+    _last_probe_vals: tuple  # (focus, playback state) parsed from _last_probe_out
     dump_deadline_secs: float  # how long the dump worker retries before giving up
+    poll_secs_max: int  # ceiling for the adaptive poll interval
+    _stable_count: int  # consecutive polls without a state change
+    _current_interval: int  # delay until the next poll
+    heartbeat_secs: float  # republish unchanged entities at least this often
+    _last_publish_ts: Dict[str, float]  # entity id -> monotonic time of last set_state
+    # entity ids / static attributes, fixed once entity_prefix is known
+    _playback_state_ent: str
+    _playback_state_attrs: Dict[str, Any]
+    _playing_ent: str
+    _playing_attrs: Dict[str, Any]
+    _is_focused_ent: str
+    _is_focused_attrs: Dict[str, Any]
+    _playback_channel_ent: str
+    _playback_channel_attrs: Dict[str, Any]
 
     def initialize(self):
         """ get values from apps.yaml """
@@ -43,16 +88,55 @@ class TwitchPlayback(hass.Hass):
         )
         self.entity_prefix = self.args.get("entity_prefix", "firetv_twitch")
         self.poll_secs = int(self.args.get("poll_interval", 5))
+        self.poll_secs_max = max(self.poll_secs, int(self.args.get("poll_interval_max", 60)))
         self.session_header = self.args.get("session_header", "TwitchMediaSession")
         self.dump_deadline_secs = float(self.args.get("dump_deadline_secs", 30))
+        self.heartbeat_secs = float(self.args.get("heartbeat_secs", 60))
+
+        # publishers only add "updated" to these (on a copy; never mutated)
+        prefix = self.entity_prefix
+        self._playback_state_ent = f"sensor.{prefix}_playback_state"
+        self._playback_state_attrs = {
+            "friendly_name": f"{prefix} playback state",
+            "meanings": self._PB_STATE_MEANINGS,
+        }
+        self._playing_ent = f"binary_sensor.{prefix}_playing"
+        self._playing_attrs = {
+            "friendly_name": f"{prefix} playing",
+            "device_class": "running",
+            "source": "dumpsys media_session",
+        }
+        self._is_focused_ent = f"binary_sensor.{prefix}_is_focused"
+        self._is_focused_attrs = {
+            "friendly_name": f"{prefix} is focused",
+            "device_class": "running",
+            "source": "dumpsys media_session",
+        }
+        self._playback_channel_ent = f"sensor.{prefix}_playback_channel"
+        self._playback_channel_attrs = {
+            "friendly_name": f"{prefix} playback channel",
+        }
 
         self.adb = None
+        try:
+            self._signer = self._load_signer()
+        except Exception as e:
+            # keys may be missing or mid-write by the Handshake app; _connect retries
+            self.log(f"Signer load failed: {e}; will retry on connect", level="WARNING")
+            self._signer = None
         self.connected = False
         self.last_playbackstate = None
         self.last_appinfocus = None
         self.last_playbackactivechannel = None
         self._adb_lock = threading.Lock()
         self._dump_in_flight = False
+        self._uia_tty_ok = None
+        self._uia_tty_misses = 0
+        self._last_probe_out = (b"", b"")
+        self._last_probe_vals = (None, None)
+        self._stable_count = 0
+        self._current_interval = self.poll_secs
+        self._last_publish_ts = {}
 
         self.run_in(self._loop, 1)
 
@@ -94,45 +178,89 @@ class TwitchPlayback(hass.Hass):
         return Handshake.load_signer(priv=self.adbkey, pub=self.adbkey_pub)
 
     def _connect(self):
+        """(Re)connect, reusing the device object and the cached signer so a
+        dropped socket only costs the adb handshake. Called from _loop only."""
         try:
-            signer = self._load_signer()
-            self.adb = AdbDeviceTcp(self.host, self.port, default_transport_timeout_s=10.0)
-            ok = self.adb.connect(rsa_keys=[signer], auth_timeout_s=10.0)
+            if self._signer is None:
+                self._signer = self._load_signer()
+            if self.adb is None:
+                self.adb = AdbDeviceTcp(self.host, self.port, default_transport_timeout_s=10.0)
+            with self._adb_lock:  # connect() closes the socket a shell may be using
+                ok = self.adb.connect(rsa_keys=[self._signer], auth_timeout_s=10.0)
             self.connected = bool(ok)
             if self.connected:
                 self.log(f"ADB connected to {self.host}:{self.port}")
+                self._enable_tcp_keepalive()
             else:
                 self.error("ADB connect returned falsy result")
         except Exception as e:
             self.connected = False
-            self.adb = None
             self.error(f"ADB connect error: {e}")
 
-    def _adb_shell(self, cmd: str) -> str:
+    def _enable_tcp_keepalive(self) -> None:
+        """Let the kernel notice a silently dropped adb socket between polls."""
+        # adb-shell doesn't expose its socket; reach through the transport
+        transport = getattr(getattr(self.adb, "_io_manager", None), "_transport", None)
+        sock = getattr(transport, "_connection", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for name, value in self._TCP_KEEPALIVE_OPTS:
+                if hasattr(socket, name):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+        except OSError as e:
+            self.log(f"Could not enable TCP keepalive: {e}", level="WARNING")
+
+    def _adb_shell(self, cmd: str) -> bytes:
+        """Run cmd, returning its raw output (b"" on failure). Output is left
+        undecoded; parsers work on bytes and decode only what they extract."""
         if not self.connected or not self.adb:
-            return ""
+            return b""
         try:
             with self._adb_lock:  # serialize; adb socket isn't thread-safe
-                data = self.adb.shell(cmd)
-            if data and isinstance(data, bytes):
-                return data.decode("utf-8")
-            elif data and isinstance(data, str):
-                return data
-            else:
-                return ""
-        except Exception as e:
+                return self.adb.shell(cmd, decode=False) or b""
+        except AdbCommandFailureException as e:
+            # the device refused the command; the connection itself is fine
             self.error(f"adb shell error for '{cmd}': {e}")
-            self.connected = False
+            return b""
+        except Exception as e:
+            # socket errors, timeouts (incl. the TV closing its end) and a
+            # desynced packet stream all leave the link unusable; a timeout
+            # may strike mid-packet, so never retry on the same connection.
+            # The next _loop tick reconnects, keeping each tick bounded.
+            self.error(f"adb connection lost during '{cmd}': {e}")
+            self._disconnect()
+            return b""
+
+    def _disconnect(self) -> None:
+        """Drop the link; the next _loop tick reconnects (reusing self.adb)."""
+        self.connected = False
+        with self._adb_lock:  # don't close the socket under an in-flight shell
             try:
                 self.adb.close()
             except Exception:
                 pass
-            self.adb = None
-            return ""
+
+    def _adb_shell_multi(self, cmds: Sequence[str]) -> List[bytes]:
+        """Run cmds in a single adb shell (one round-trip) and return each
+        one's output. They share that shell, so later commands see variables
+        set by earlier ones. Missing outputs (e.g. on failure) come back b""."""
+        out = self._adb_shell(f"; echo {self._SHELL_SEP.decode()}; ".join(cmds))
+        parts = out.split(self._SHELL_SEP) if out else []
+        # drop the newline echo leaves after each separator
+        parts[1:] = [part.lstrip(b"\r\n") for part in parts[1:]]
+        parts += [b""] * (len(cmds) - len(parts))
+        return parts[:len(cmds)]
 
     # ----------- Parsing + publishing -----------
 
-    def _parse_twitch_playbackstate(self, text: str):
+    @staticmethod
+    def _utc_now_iso() -> str:
+        """UTC timestamp for the 'updated' attributes (taken once per poll)"""
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _parse_twitch_playbackstate(self, text: bytes):
         """
         Return Twitch PlaybackState 'state' (int) or None.
         Strategy: find the Twitch header line, then scan the next ~40 lines
@@ -141,62 +269,72 @@ class TwitchPlayback(hass.Hass):
         if not text:
             return None
 
-        # 1) fast path: exact header anchor (cheap and reliable)
-        anchor = "TwitchMediaSession tv.twitch.android.viewer/TwitchMediaSession"
-        idx = text.find(anchor)
-        if idx != -1:
-            after = text[idx:].splitlines()
-            for line in after[:40]:
-                m = re.search(r"PlaybackState\s*\{[^}]*\bstate\s*=\s*(\d+)\b", line)
-                if m:
-                    return int(m.group(1))
-            # fall through if not seen in first 40 lines
-
-        # 2) fallback: header → playback within a limited window (regex)
-        m2 = re.search(
-            (r"TwitchMediaSession\s+tv\.twitch\.android\.viewer/.*?(?:\n.*){0,40}?"
-             r"PlaybackState\s*\{[^}]*\bstate\s*=\s*(\d+)\b"),
-            text,
-            re.DOTALL,
-        )
-        if m2:
-            return int(m2.group(1))
-
+        # Only bounded bytes.find calls, no regex: anchor, window, token.
+        idx = text.find(b"TwitchMediaSession tv.twitch.android.viewer")
+        if idx == -1:
+            return None
+        stop = idx
+        for _ in range(40):
+            stop = text.find(b"\n", stop) + 1
+            if stop == 0:
+                stop = len(text)
+                break
+        pb = text.find(b"PlaybackState", idx, stop)
+        while pb != -1:
+            eol = text.find(b"\n", pb, stop)
+            if eol == -1:
+                eol = stop
+            start = text.find(b"state=", pb + len(b"PlaybackState"), eol)
+            if start != -1:
+                start += len(b"state=")
+                end = start
+                while end < eol and text[end] in b"0123456789":
+                    end += 1
+                if end > start:
+                    return int(text[start:end])
+            pb = text.find(b"PlaybackState", pb + 1, stop)
         return None
 
-    def _publish_twitch_playbackstate(self, state_val):
-        updated_iso = datetime.utcnow().isoformat() + "Z"
-
-        # numeric sensor
-        sensor_ent = f"sensor.{self.entity_prefix}_playback_state"
-        attrs = {
-            "friendly_name": f"{self.entity_prefix} playback state",
-            "updated": updated_iso,
-            "meanings": {
-                "1": "stopped/idle/menu",
-                "3": "playing",
-                "6": "transition/unknown (observed)",
-            },
-        }
-        self.set_state(sensor_ent,
-                       state=state_val if state_val is not None else "unknown",
-                       attributes=attrs)
-
-        # binary_sensor: on when state==3
-        bin_ent = f"binary_sensor.{self.entity_prefix}_playing"
+    def _parse_probe(self, window_out: bytes, media_out: bytes) -> tuple:
+        """Parse the probe output into (focus, playback state). Quiet polls
+        often return byte-identical output; reuse the last parse then."""
+        out = (window_out, media_out)
+        if window_out and out == self._last_probe_out:
+            return self._last_probe_vals
+        focus_val = self._parse_twitch_appinfocus(window_out) if window_out else None
+        playback_state_val = (self._parse_twitch_playbackstate(media_out)
+                              if focus_val and media_out else None)
+        self._last_probe_out = out
+        self._last_probe_vals = (focus_val, playback_state_val)
+        return self._last_probe_vals
+
+    def _publish_due(self, entity_id: str, changed: bool) -> bool:
+        """True if entity_id should be written now: on a change, or once
+        heartbeat_secs have passed so 'updated' keeps showing liveness."""
+        now = time.monotonic()
+        last = self._last_publish_ts.get(entity_id)
+        if changed or last is None or now - last >= self.heartbeat_secs:
+            self._last_publish_ts[entity_id] = now
+            return True
+        return False
+
+    def _publish_twitch_playbackstate(self, state_val, updated_iso: str):
+        changed = state_val != self.last_playbackstate
         is_playing = state_val == 3
-        self.set_state(
-            bin_ent,
-            state="on" if is_playing else "off",
-            attributes={
-                "friendly_name": f"{self.entity_prefix} playing",
-                "device_class": "running",
-                "updated": updated_iso,
-                "source": "dumpsys media_session",
-            },
-        )
+        if self._publish_due(self._playback_state_ent, changed):
+            # numeric sensor
+            self.set_state(self._playback_state_ent,
+                           state=state_val if state_val is not None else "unknown",
+                           attributes={**self._playback_state_attrs, "updated": updated_iso})
+
+            # binary_sensor: on when state==3
+            self.set_state(
+                self._playing_ent,
+                state="on" if is_playing else "off",
+                attributes={**self._playing_attrs, "updated": updated_iso},
+            )
 
-        if state_val != self.last_playbackstate:
+        if changed:
             self.last_playbackstate = state_val
             self.fire_event(
                 "twitch_playback_state_changed",
@@ -205,36 +343,38 @@ class TwitchPlayback(hass.Hass):
                 playing=is_playing,
             )
 
-    def _parse_twitch_appinfocus(self, text: str):
+    def _parse_twitch_appinfocus(self, text: bytes):
         """
-        Return Twitch PlaybackState 'state' (int) or None.
-        Strategy: find the Twitch header line, then scan the next ~40 lines
-        for the first 'PlaybackState {state=...}'.
+        Return True if Twitch holds the current window focus, else False
+        (None if there is no text to inspect).
+        Strategy: jump between 'mCurrentFocus=' occurrences with bytes.find
+        and check only those lines for the Twitch package name.
         """
         if not text:
             return None
 
-        # 1) fast path: exact header anchor (cheap and reliable)
-        anchor = "tv.twitch.android.viewer"
-        return any([anchor in x and "mCurrentFocus=" in x for x in text.split("\n")])
-
-    def _publish_twitch_appinfocus(self, state_val):
-        updated_iso = datetime.utcnow().isoformat() + "Z"
-
-        bin_ent = f"binary_sensor.{self.entity_prefix}_is_focused"
+        anchor = b"tv.twitch.android.viewer"
+        idx = text.find(b"mCurrentFocus=")
+        while idx != -1:
+            eol = text.find(b"\n", idx)
+            if eol == -1:
+                eol = len(text)
+            if text.find(anchor, idx, eol) != -1:
+                return True
+            idx = text.find(b"mCurrentFocus=", eol)
+        return False
+
+    def _publish_twitch_appinfocus(self, state_val, updated_iso: str):
+        changed = state_val != self.last_appinfocus
         is_focused = state_val
-        self.set_state(
-            bin_ent,
-            state="on" if is_focused else "off",
-            attributes={
-                "friendly_name": f"{self.entity_prefix} is focused",
-                "device_class": "running",
-                "updated": updated_iso,
-                "source": "dumpsys media_session",
-            },
-        )
+        if self._publish_due(self._is_focused_ent, changed):
+            self.set_state(
+                self._is_focused_ent,
+                state="on" if is_focused else "off",
+                attributes={**self._is_focused_attrs, "updated": updated_iso},
+            )
 
-        if state_val != self.last_appinfocus:
+        if changed:
             self.last_appinfocus = state_val
             self.fire_event(
                 "twitch_is_focused_changed",
@@ -242,20 +382,15 @@ class TwitchPlayback(hass.Hass):
                 state=state_val,
             )
 
-    def _publish_twitch_playbackactivechannel(self, state_val):
-        updated_iso = datetime.utcnow().isoformat() + "Z"
-
-        # numeric sensor
-        sensor_ent = f"sensor.{self.entity_prefix}_playback_channel"
-        attrs = {
-            "friendly_name": f"{self.entity_prefix} playback channel",
-            "updated": updated_iso,
-        }
-        self.set_state(sensor_ent,
-                       state=state_val if state_val is not None else "unknown",
-                       attributes=attrs)
+    def _publish_twitch_playbackactivechannel(self, state_val, updated_iso: str):
+        changed = state_val != self.last_playbackactivechannel
+        if self._publish_due(self._playback_channel_ent, changed):
+            # numeric sensor
+            self.set_state(self._playback_channel_ent,
+                           state=state_val if state_val is not None else "unknown",
+                           attributes={**self._playback_channel_attrs, "updated": updated_iso})
 
-        if state_val != self.last_playbackactivechannel:
+        if changed:
             self.last_playbackactivechannel = state_val
             self.fire_event(
                 "twitch_playback_active_channel_changed",
@@ -264,15 +399,38 @@ class TwitchPlayback(hass.Hass):
             )
 
     # ----------- Main loop -----------
-    def _uia_dump_xml(self) -> Optional[str]:
-        """One dump attempt: write the UI hierarchy to a file, then read it back.
+    def _uia_dump_xml(self) -> Optional[bytes]:
+        """One dump attempt. Stream the UI hierarchy over stdout (one shell, no
+        sdcard write); use the file-based dump if stdout yields no XML.
         Returns the XML, or None if the (flaky) dump failed. _dump_worker retries."""
+        if self._uia_tty_ok is not False:
+            out = self._adb_shell("uiautomator dump --compressed /dev/tty 2>/dev/null")
+            if b"<hierarchy" in out:
+                self._uia_tty_ok = True
+                self._uia_tty_misses = 0
+                # drop the "UI hierchary dumped to: /dev/tty" chatter around the XML
+                start = out.find(b"<?xml")
+                if start == -1:
+                    start = out.find(b"<hierarchy")
+                end = out.rfind(b"</hierarchy>")
+                return out[start:end + len(b"</hierarchy>")] if end != -1 else out[start:]
+        xml_text = self._uia_dump_xml_file()
+        if xml_text is not None and self._uia_tty_ok is None:
+            # the file dump works where stdout didn't; if that keeps happening,
+            # stdout mode is unsupported here: stop trying it
+            self._uia_tty_misses += 1
+            if self._uia_tty_misses >= self._UIA_TTY_MAX_MISSES:
+                self._uia_tty_ok = False
+        return xml_text
+
+    def _uia_dump_xml_file(self) -> Optional[bytes]:
+        """Dump attempt via a file: write the UI hierarchy out, then read it back."""
         dump_path = "/sdcard/window_dump.xml"
         out = self._adb_shell(f"uiautomator dump --compressed {dump_path} 2>&1")
-        if f"UI hierchary dumped to: {dump_path}" not in out:
+        if f"UI hierchary dumped to: {dump_path}".encode() not in out:
             return None
         xml_text = self._adb_shell(f"cat {dump_path}")
-        if not xml_text or "<hierarchy" not in xml_text:
+        if not xml_text or b"<hierarchy" not in xml_text:
             self.error(f"Failed to read UI dump from {dump_path}; "
                        f"cat returned: {repr(xml_text)[:120]}")
             return None
@@ -285,7 +443,7 @@ class TwitchPlayback(hass.Hass):
         deadline = time.monotonic() + self.dump_deadline_secs
         while time.monotonic() < deadline:
             try:
-                name = self.find_streamer_name(self._uia_dump_xml() or "")
+                name = self.find_streamer_name(self._uia_dump_xml() or b"")
             except Exception as e:
                 self.error(f"dump worker error: {e}")
                 name = None
@@ -298,54 +456,86 @@ class TwitchPlayback(hass.Hass):
         """submit_to_executor callback (runs on a normal worker thread). Publish
         the channel, or "unknown" on failure so breakage stays visible."""
         self._dump_in_flight = False
-        self._publish_twitch_playbackactivechannel(result or "unknown")
+        channel = result or "unknown"
+        if channel != self.last_playbackactivechannel:
+            # the next poll is already scheduled; snap back for the ones after
+            self._stable_count = 0
+            self._current_interval = self.poll_secs
+        self._publish_twitch_playbackactivechannel(channel, self._utc_now_iso())
+
+    def _observed_state(self) -> tuple:
+        return (self.last_appinfocus, self.last_playbackstate,
+                self.last_playbackactivechannel)
+
+    def _next_interval(self, changed: bool) -> int:
+        """Poll at poll_secs while things move; once the state has been steady
+        for a few polls, double the delay each poll up to poll_secs_max."""
+        if changed:
+            self._stable_count = 0
+            self._current_interval = self.poll_secs
+        else:
+            self._stable_count += 1
+            if self._stable_count > self._BACKOFF_AFTER_POLLS:
+                self._current_interval = min(self._current_interval * 2,
+                                             self.poll_secs_max)
+        return self._current_interval
 
     def _loop(self, _):
+        before = self._observed_state()
         try:
             if not self.connected or self.adb is None:
                 self._connect()
 
             if self.connected:
+                focus_val, playback_state_val = self._parse_probe(
+                    *self._adb_shell_multi(self._PROBE_CMDS))
+                updated_iso = self._utc_now_iso()
+
                 # Determine if twitch app is in current focus
-                out = self._adb_shell("dumpsys window")
-                state_val = self._parse_twitch_appinfocus(out) if out else None
-                self._publish_twitch_appinfocus(state_val)
-                out = None
-                state_val = None
+                self._publish_twitch_appinfocus(focus_val, updated_iso)
+                if not focus_val:
+                    # Twitch isn't in the foreground, so its playback state and
+                    # channel are meaningless (media_session wasn't run either).
+                    self._publish_twitch_playbackstate(None, updated_iso)
+                    self._publish_twitch_playbackactivechannel("unknown", updated_iso)
+                    return
 
                 # Determine playback state of twitch app
-                out = self._adb_shell("dumpsys media_session")
-                state_val = self._parse_twitch_playbackstate(out) if out else None
-                self._publish_twitch_playbackstate(state_val)
-                out = None
-                state_val = None
+                self._publish_twitch_playbackstate(playback_state_val, updated_iso)
 
                 # Determine what channel is currently being watched.
-                # get_state returns the "on"/"off" strings; compare explicitly
-                # since "off" is truthy.
-                is_focused = self.get_state("binary_sensor.firetv_twitch_is_focused") == "on"
-                is_playing = self.get_state("binary_sensor.firetv_twitch_playing") == "on"
-                if is_focused and is_playing:
+                if playback_state_val == 3:
                     # Dump is flaky/slow: run off-thread so _loop stays under
                     # AppDaemon's 10s limit; _on_dump_result publishes it.
                     if not self._dump_in_flight:
                         self._dump_in_flight = True
                         self.submit_to_executor(self._dump_worker, callback=self._on_dump_result)
                 else:
-                    self._publish_twitch_playbackactivechannel("unknown")
+                    self._publish_twitch_playbackactivechannel("unknown", updated_iso)
 
         except Exception as e:
             self.error(f"Poll error: {e}")
             self.connected = False
         finally:
-            self.run_in(self._loop, self.poll_secs)
+            # a dead link must not be left to back off to poll_secs_max
+            changed = self._observed_state() != before or not self.connected
+            self.run_in(self._loop, self._next_interval(changed))
 
     @staticmethod
-    def find_streamer_name(xml_text: str) -> str | None:
+    def find_streamer_name(xml_text: bytes) -> str | None:
         """
         find stramers name in text blob
         """
-        match = re.search(r"\"Go to (?P<name>\S+)'s profile(?:\.\.\.)?", xml_text)
-        if match:
-            return match.group("name")
+        # '"Go to <name>'s profile' located with find; no regex over the dump
+        prefix = b'"Go to '
+        idx = xml_text.find(prefix)
+        while idx != -1:
+            start = idx + len(prefix)
+            end = xml_text.find(b"'s profile", start)
+            if end == -1:
+                return None
+            name = xml_text[start:end]
+            if name and name.split() == [name]:  # a single whitespace-free token
+                return name.decode("utf-8", "replace")
+            idx = xml_text.find(prefix, start)
         return None